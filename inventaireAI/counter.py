@@ -49,6 +49,15 @@ def get_unique_filepath(folder, filename):
         counter += 1
     return os.path.join(folder, new_filename)
 
+def _fast_move(src, dst):
+    """Moves within the same filesystem with a single rename();
+    shutil.move and its stat/copy probing only run as a fallback
+    (e.g. cross-device destination)."""
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
 def resize_and_convert_to_base64(image_path, max_size=None):
     if max_size is None:
         max_size = (THUMBNAIL_MAX_WIDTH, THUMBNAIL_MAX_HEIGHT)
@@ -462,7 +471,7 @@ def process_inventory(input_path, target_element=None, progress_callback=None, s
                  try:
                      compress_image_to_target(original_path, temp_path)
                      if os.path.exists(temp_path):
-                         shutil.move(temp_path, new_path_full)
+                         _fast_move(temp_path, new_path_full)
                          if new_path_full != original_path and os.path.exists(original_path):
                              os.remove(original_path)
                          print(f"  Renamed to: {new_filename}")
@@ -475,7 +484,7 @@ def process_inventory(input_path, target_element=None, progress_callback=None, s
              try:
                  compress_image_to_target(original_path, temp_path)
                  if os.path.exists(temp_path):
-                     shutil.move(temp_path, original_path)
+                     _fast_move(temp_path, original_path)
              except Exception as e:
                  print(f"  Optimization failed: {e}")
 
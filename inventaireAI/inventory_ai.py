@@ -67,13 +67,19 @@ def analyze_image(image_path, categories_context=None, user_hint=None, folder_co
 
         # Use context manager to ensure file is closed after reading
         with Image.open(image_path) as img:
-            # Force load image data so we can close the file
-            img.load()
-
             # Resize image to max 800x800 for API efficiency (lightest possible)
             max_width = int(os.getenv("GEMINI_MAX_WIDTH", 800))
             max_height = int(os.getenv("GEMINI_MAX_HEIGHT", 800))
-            img.thumbnail((max_width, max_height))
+
+            # Let libjpeg decode at reduced scale before the final resize
+            try:
+                img.draft("RGB", (max_width * 2, max_height * 2))
+            except Exception:
+                pass
+
+            # Force load image data so we can close the file
+            img.load()
+            img.thumbnail((max_width, max_height), Image.Resampling.BILINEAR)
 
             # Convert to compressed JPEG bytes to minimize upload size
             img_byte_arr = io.BytesIO()
@@ -251,7 +257,7 @@ def analyze_image_multiple(image_path, target_element=None, categories_context=N
                 # Standard mode: Resize to max 800x800 for API efficiency
                 max_width = int(os.getenv("GEMINI_MAX_WIDTH", 800))
                 max_height = int(os.getenv("GEMINI_MAX_HEIGHT", 800))
-                img.thumbnail((max_width, max_height))
+                img.thumbnail((max_width, max_height), Image.Resampling.BILINEAR)
 
                 # Convert RGBA/P to RGB for JPEG compatibility
                 if img.mode in ("RGBA", "P"):
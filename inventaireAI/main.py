@@ -51,6 +51,15 @@ def get_unique_filepath(folder, filename):
         counter += 1
     return os.path.join(folder, new_filename)
 
+def _fast_move(src, dst):
+    """Moves within the same filesystem with a single rename();
+    shutil.move and its stat/copy probing only run as a fallback
+    (e.g. cross-device destination)."""
+    try:
+        os.rename(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
 def resize_and_convert_to_base64(image_path, max_size=None):
     if max_size is None:
         max_size = (THUMBNAIL_MAX_WIDTH, THUMBNAIL_MAX_HEIGHT)
@@ -82,7 +91,7 @@ def compress_image_to_target(source_path, dest_path, max_size_kb=None):
     # If source exists and is already small enough
     if os.path.exists(source_path) and os.path.getsize(source_path) <= target_size_bytes:
         if source_path != dest_path:
-            shutil.move(source_path, dest_path)
+            _fast_move(source_path, dest_path)
         return
 
     # If too big, compress
@@ -139,7 +148,7 @@ def compress_image_to_target(source_path, dest_path, max_size_kb=None):
         print(f"Error compressing {source_path}: {e}")
         # Fallback: just move if possible
         if source_path != dest_path and os.path.exists(source_path):
-            shutil.move(source_path, dest_path)
+            _fast_move(source_path, dest_path)
 
 def main():
     parser = argparse.ArgumentParser(description="Automate inventory from images.")
@@ -395,7 +404,7 @@ def main():
                 if os.path.exists(dest_path):
                      dest_path = get_unique_filepath(review_dir, filename)
 
-                shutil.move(original_path, dest_path)
+                _fast_move(original_path, dest_path)
                 print(f"  Moved to manual review: {os.path.basename(dest_path)}")
 
                 # Skip adding to CSV only if move was successful
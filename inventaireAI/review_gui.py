@@ -2,13 +2,18 @@ import os
 import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from PIL import Image, ImageTk, ImageDraw
+from PIL import Image, ImageTk, ImageDraw, ImageFile
 import pandas as pd
-import argparse
+import numpy as np
 import ast
-from inventory_ai import analyze_image, analyze_image_multiple, load_categories
+import io
+import json
+import mmap
 from dotenv import load_dotenv
 import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from ui_utils import ToolTip
 
 # Load environment variables
@@ -19,6 +24,87 @@ CSV_DECIMAL = os.getenv("CSV_DECIMAL", ".")
 PROCESSED_FOLDER_NAME = "traitees"
 RETAKE_FOLDER_NAME = "a_refaire"
 
+# Show what can be decoded of a half-written file (e.g. camera still
+# uploading) instead of erroring out of the whole preview
+ImageFile.LOAD_TRUNCATED_IMAGES = True
+
+# Formats actually produced by phones/scanners in the field; restricting the
+# probe skips Image.open trying every registered decoder in turn
+_IMAGE_FORMATS = ["JPEG", "PNG", "WEBP", "BMP", "GIF", "TIFF"]
+
+# Shared categories.csv cache (id -> nom), loaded once per process
+_CATEGORY_CACHE = None
+
+# inventory_ai drags in the Gemini SDK (seconds of import time) and requires
+# an API key; the review GUI is fully usable without it, so only import the
+# module when the user actually launches a scan.
+_AI_MODULE = None
+
+def _get_ai():
+    global _AI_MODULE
+    if _AI_MODULE is None:
+        import inventory_ai
+        _AI_MODULE = inventory_ai
+    return _AI_MODULE
+
+def parse_box(val):
+    """Returns a [ymin, xmin, ymax, xmax] list, or None if not a valid box."""
+    if isinstance(val, list):
+        return val if len(val) == 4 else None
+    if isinstance(val, str) and val:
+        # Box strings are plain JSON lists; json.loads is much cheaper than
+        # ast.literal_eval (which compiles a full AST). Keep literal_eval as
+        # fallback for legacy values (e.g. tuples or single quotes).
+        try:
+            box = json.loads(val)
+        except Exception:
+            try:
+                box = ast.literal_eval(val)
+            except Exception:
+                return None
+        if isinstance(box, (list, tuple)) and len(box) == 4:
+            return list(box)
+    return None
+
+def _safe_int(val):
+    """Parses an int without raising; returns None on invalid input.
+    The isdigit pre-check keeps the common valid case exception-free."""
+    s = str(val).strip()
+    if s.lstrip("+-").isdigit():
+        try:
+            return int(s)
+        except ValueError:
+            return None
+    return None
+
+def _safe_float(val):
+    """Parses a float (accepting comma decimals); returns None on invalid."""
+    if isinstance(val, (int, float)):
+        return float(val) if val == val else None # NaN check
+    s = str(val).strip().replace(',', '.')
+    if not s or not (s[0].isdigit() or s[0] in '+-.'):
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+# Scan results follow a fixed schema: resolve each numeric key to its
+# coercion with one dict lookup instead of re-branching on the key name
+# for every field of every result
+_COERCERS = {
+    "quantite": lambda v: int(float(str(v))),
+    "prix_unitaire_estime": lambda v: float(str(v)),
+    "prix_neuf_estime": lambda v: float(str(v)),
+}
+
+# UI column -> scan result key, shared by every scan result handler
+FIELDS_MAP = {
+    "Nom": "nom", "Categorie": "categorie", "Etat": "etat",
+    "Quantite": "quantite", "Prix Unitaire": "prix_unitaire_estime",
+    "Prix Neuf Estime": "prix_neuf_estime"
+}
+
 class ReviewApp:
     def __init__(self, root, csv_path):
         self.root = root
@@ -41,10 +127,35 @@ class ReviewApp:
         self.original_image_object = None # Store PIL image for resizing
         self.current_box_2d = None
         self.show_all_boxes_var = tk.BooleanVar(value=False)
-        self.box_map = {} # canvas_id -> df_id
-
-        # Load AI Context
-        self.categories_context = load_categories() if load_categories else None
+        self.box_map = {} # canvas_id -> df_id (active box only)
+        self._sibling_boxes = {} # df_id (as str) -> box_2d baked into the bitmap
+        self._hover_rect = None # Temporary canvas highlight over a baked box
+        self._pending_siblings = [] # Rows not yet inserted in the sibling tree
+        self._sibling_insert_job = None
+        self._sibling_current_id = None
+        self._tree_iid_by_id = {} # df "ID" (as str) -> treeview item id
+        self._next_sibling = {} # df index -> next df index in the same image
+        self._siblings_by_file = {} # filename -> [df indices] (rebuilt with links)
+        self._deleted = set() # tombstoned df indices, compacted at save time
+        self._image_paths = {} # filename -> resolved absolute path
+        self._resize_job = None # pending after() id for debounced canvas resize
+        self._rot_save_job = None # pending after() id for a coalesced rotation write
+        self._pending_rotation = None # (path, rotated PIL image) not yet on disk
+        self._img_cache = OrderedDict() # (path, w, h) -> display-sized PIL image
+        self._display_gen = 0 # bumped per display request; stale resizes are dropped
+        self._resize_executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2) # warms the preview LRU
+        self._dirty = False # unsaved df changes pending
+        self._save_after_id = None # pending after() id for debounced save
+        self._save_lock = threading.Lock()
+        self._save_snapshot = None # newest frame waiting for the writer thread
+        self._save_thread_running = False
+        self._journal_path = csv_path + ".changes.jsonl" # per-edit crash journal
+        # Flush any pending save if the window is closed mid-edit
+        self.root.bind("<Destroy>", self._on_root_destroy, add="+")
+
+        # AI context is loaded together with the AI module on the first scan
+        self.categories_context = None
         
         if self.load_data():
             self.setup_ui()
@@ -71,8 +182,29 @@ class ReviewApp:
             return False
             
         try:
-            self.df = pd.read_csv(self.csv_path, sep=CSV_SEPARATOR, decimal=CSV_DECIMAL)
-            
+            # Dtype hints skip pandas' per-column type inference; retry
+            # without them for legacy files that don't match (e.g. float IDs)
+            dtype_hints = {"Nom": str, "Categorie": str, "Etat": str,
+                           "Fichier": str, "Fichier Original": str,
+                           "Commentaire": str, "Box 2D": str}
+            self.df = self._read_feather_cache()
+            cold_start = self.df is None
+            if self.df is None and CSV_DECIMAL == ".":
+                # pyarrow parses CSV multi-threaded in C. Like the fast write
+                # path it cannot produce comma decimals, so only try it for
+                # the default "." (any failure falls through to the C engine)
+                try:
+                    self.df = pd.read_csv(self.csv_path, sep=CSV_SEPARATOR, dtype=dtype_hints, engine="pyarrow")
+                except Exception:
+                    self.df = None
+            if self.df is None:
+                try:
+                    self.df = pd.read_csv(self.csv_path, sep=CSV_SEPARATOR, decimal=CSV_DECIMAL, dtype=dtype_hints)
+                except (ValueError, TypeError):
+                    self.df = pd.read_csv(self.csv_path, sep=CSV_SEPARATOR, decimal=CSV_DECIMAL)
+            if cold_start:
+                self._write_feather_cache(self.df)
+
             if "ID" not in self.df.columns:
                 print("Legacy CSV detected (missing ID). Generating IDs...")
                 self.df.insert(0, "ID", range(1, 1 + len(self.df)))
@@ -81,14 +213,29 @@ class ReviewApp:
             price_cols = ["Prix Unitaire", "Prix Neuf Estime", "Prix Total"]
             for col in price_cols:
                 if col in self.df.columns:
-                     self.df[col] = self.df[col].astype(str).str.replace(',', '.', regex=False)
-                     self.df[col] = pd.to_numeric(self.df[col], errors='coerce').fillna(0.0)
+                     # read_csv already parsed CSV_DECIMAL natively; only do
+                     # the string cleanup when the column still came out as
+                     # text (legacy files mixing separators). Dtype check and
+                     # not == object: newer pandas parses text as StringDtype
+                     if not pd.api.types.is_numeric_dtype(self.df[col]):
+                         self.df[col] = self.df[col].astype(str).str.replace(',', '.', regex=False)
+                         self.df[col] = pd.to_numeric(self.df[col], errors='coerce').fillna(0.0)
+                     else:
+                         self.df[col] = self.df[col].fillna(0.0)
             
             if "Commentaire" not in self.df.columns:
                 self.df["Commentaire"] = ""
             else:
                 self.df["Commentaire"] = self.df["Commentaire"].fillna("")
-            
+
+            # Pre-parse bounding boxes once: navigation then gets plain lists
+            # instead of running ast.literal_eval on every display
+            if "Box 2D" in self.df.columns:
+                self.df["Box 2D"] = self.df["Box 2D"].map(parse_box)
+
+            # Recover edits that were journaled but never flushed to the CSV
+            self._replay_journal()
+
             if "Fiabilite" in self.df.columns:
                 self.df["Fiabilite"] = pd.to_numeric(self.df["Fiabilite"], errors='coerce').fillna(0)
                 # Review everything (including 100% reliable items)
@@ -97,14 +244,14 @@ class ReviewApp:
                 # Determine which column holds the filename
                 file_col = "Fichier Original" if "Fichier Original" in self.df.columns else "Fichier"
 
-                # Group by filename and find the minimum reliability for each file
-                file_scores = review_candidates.groupby(file_col)["Fiabilite"].min().reset_index()
-
-                # Sort files by their worst (minimum) reliability score
-                file_scores = file_scores.sort_values("Fiabilite", ascending=True)
+                # Group by filename and find the minimum reliability for each
+                # file, then order with a single numpy argsort (cheaper than
+                # building an intermediate frame and sort_values on it)
+                file_scores = review_candidates.groupby(file_col, sort=False)["Fiabilite"].min()
+                order = np.argsort(file_scores.to_numpy(), kind="stable")
 
-                # The queue is now a list of unique filenames
-                self.review_queue = file_scores[file_col].tolist()
+                # The queue is a list of unique filenames, worst score first
+                self.review_queue = file_scores.index.to_numpy()[order].tolist()
             else:
                 self.review_queue = []
                 
@@ -112,14 +259,196 @@ class ReviewApp:
             messagebox.showerror("Erreur", f"Impossible de lire le CSV: {e}")
             self.root.destroy()
             return False
-            
+
+        # Resolve image locations once: two directory scans replace the two
+        # stat() calls show_current_item used to make on every navigation.
+        # processed_dir wins, matching the old lookup order.
+        self._image_paths = {}
+        for directory in (self.processed_dir, self.folder_path):
+            try:
+                for entry in os.scandir(directory):
+                    self._image_paths.setdefault(entry.name, entry.path)
+            except OSError:
+                pass
+
+        self._rebuild_sibling_links()
         return True
 
-    def save_data(self):
+    def _read_feather_cache(self):
+        """Warm-start cache: re-parsing the CSV dominates launch time, and a
+        feather copy of the last parse reads several times faster. The CSV
+        stays the source of truth — the cache is ignored whenever it is
+        older than the CSV (e.g. edited in Excel) and rebuilt on save."""
+        cache_path = self.csv_path + ".feather"
+        try:
+            if os.path.getmtime(cache_path) < os.path.getmtime(self.csv_path):
+                return None
+            return pd.read_feather(cache_path)
+        except Exception:
+            return None
+
+    def _write_feather_cache(self, df):
+        # Best effort (needs pyarrow). Object columns are stringified like
+        # the fast CSV path so arrow doesn't infer a nested type for boxes;
+        # parse_box rebuilds the lists on the next load.
+        cache_path = self.csv_path + ".feather"
+        try:
+            out = df.copy()
+            for col in out.columns:
+                if out[col].dtype == object:
+                    out[col] = out[col].map(lambda v: "" if v is None or (isinstance(v, float) and pd.isna(v)) else str(v))
+            out.reset_index(drop=True).to_feather(cache_path)
+        except Exception:
+            # A stale cache is worse than none
+            try:
+                if os.path.exists(cache_path): os.remove(cache_path)
+            except Exception:
+                pass
+
+    def _write_csv_fast(self, df, temp_path):
+        # pyarrow writes CSV in C, several times faster than DataFrame.to_csv.
+        # It cannot produce comma decimals or a BOM itself, so only use it for
+        # the default "." decimal and prepend the BOM manually. Returns False
+        # if pyarrow is unavailable or anything goes wrong (caller falls back).
+        if CSV_DECIMAL != ".":
+            return False
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            return False
+        try:
+            out = df.copy()
+            for col in out.columns:
+                if out[col].dtype == float:
+                    out[col] = out[col].map(lambda v: "" if pd.isna(v) else "%.2f" % v)
+                elif out[col].dtype == object:
+                    # Arrow can't serialize mixed objects (e.g. Box 2D lists)
+                    out[col] = out[col].map(lambda v: "" if v is None or (isinstance(v, float) and pd.isna(v)) else str(v))
+            table = pa.Table.from_pandas(out, preserve_index=False)
+            with open(temp_path, "wb") as f:
+                f.write(b"\xef\xbb\xbf")  # utf-8-sig BOM for Excel
+                pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(delimiter=CSV_SEPARATOR))
+            return True
+        except Exception:
+            return False
+
+    def _schedule_save(self):
+        """Debounced save: coalesces rapid edits into a single CSV write."""
+        self._dirty = True
+        if self._save_after_id is not None:
+            try: self.root.after_cancel(self._save_after_id)
+            except Exception: pass
+        self._save_after_id = self.root.after(500, self._flush_save)
+
+    def _flush_save(self):
+        """Writes immediately if a debounced save is still pending."""
+        if self._save_after_id is not None:
+            try: self.root.after_cancel(self._save_after_id)
+            except Exception: pass
+            self._save_after_id = None
+        if self._dirty:
+            self.save_data()
+
+    def _on_root_destroy(self, event):
+        if event.widget is self.root:
+            try: self._flush_rotation()
+            except Exception: pass
+            if self._dirty:
+                # Synchronous: a daemon writer could be killed mid-write on exit
+                try: self.save_data(sync=True)
+                except Exception: pass
+
+    def _journal_append(self, idx, patch):
+        """Logs one edit to the sidecar journal: O(1) bytes per edit, so the
+        debounce window is covered without rewriting the whole CSV. patch=None
+        records a deletion. Keyed by the stable ID column, not the df index."""
+        try:
+            row_id = self.df.at[idx, "ID"]
+            with open(self._journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"id": str(row_id), "patch": patch}, default=str) + "\n")
+        except Exception:
+            pass
+
+    def _journal_clear(self):
+        try:
+            if os.path.exists(self._journal_path):
+                os.remove(self._journal_path)
+        except Exception:
+            pass
+
+    def _replay_journal(self):
+        """Re-applies edits from a journal left behind by a crash before the
+        debounced CSV rewrite could run."""
+        if not os.path.exists(self._journal_path):
+            return
+        try:
+            with open(self._journal_path, "r", encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        except Exception:
+            return
+        if not entries or "ID" not in self.df.columns:
+            self._journal_clear()
+            return
+        id_to_idx = {str(v): i for i, v in zip(self.df.index, self.df["ID"])}
+        dirty = False
+        for entry in entries:
+            idx = id_to_idx.get(str(entry.get("id")))
+            if idx is None:
+                continue
+            patch = entry.get("patch")
+            if patch is None:
+                self.df = self.df.drop(index=idx)
+                id_to_idx.pop(str(entry.get("id")), None)
+            else:
+                for col, val in patch.items():
+                    if col in self.df.columns:
+                        self.df.at[idx, col] = val
+            dirty = True
+        if dirty:
+            print("Journal de modifications rejoué (sauvegarde interrompue détectée).")
+            self._schedule_save()
+        else:
+            self._journal_clear()
+
+    def save_data(self, sync=False):
+        self._dirty = False
+        # Compact tombstoned rows now: one copy per save instead of one
+        # full-frame copy per delete
+        if self._deleted:
+            self.df = self.df.drop(index=self._deleted, errors="ignore")
+            self._deleted.clear()
+
+        if sync:
+            self._write_frame(self.df)
+            return
+
+        # Serialize on a worker thread so large flushes don't stall Tk.
+        # Only the newest snapshot matters: if a write is in flight, it
+        # picks this one up when it finishes.
+        with self._save_lock:
+            self._save_snapshot = self.df.copy(deep=False)
+            if self._save_thread_running:
+                return
+            self._save_thread_running = True
+        threading.Thread(target=self._save_worker, daemon=True).start()
+
+    def _save_worker(self):
+        while True:
+            with self._save_lock:
+                snapshot = self._save_snapshot
+                self._save_snapshot = None
+                if snapshot is None:
+                    self._save_thread_running = False
+                    return
+            self._write_frame(snapshot)
+
+    def _write_frame(self, df):
         try:
             temp_path = self.csv_path + ".tmp"
-            self.df.to_csv(temp_path, index=False, encoding='utf-8-sig', sep=CSV_SEPARATOR, decimal=CSV_DECIMAL, float_format='%.2f')
-            
+            if not self._write_csv_fast(df, temp_path):
+                df.to_csv(temp_path, index=False, encoding='utf-8-sig', sep=CSV_SEPARATOR, decimal=CSV_DECIMAL, float_format='%.2f')
+
             if os.path.exists(temp_path):
                 try:
                     os.replace(temp_path, self.csv_path)
@@ -127,9 +456,21 @@ class ReviewApp:
                     if os.path.exists(self.csv_path):
                         os.remove(self.csv_path)
                     os.rename(temp_path, self.csv_path)
-                    
+
+            # The CSV on disk now covers everything journaled so far; only
+            # drop the journal once the write actually landed, so a crash
+            # or failed write mid-save still replays on the next launch
+            self._journal_clear()
+
+            # Refresh the warm-start cache so the next launch skips the parse
+            self._write_feather_cache(df)
+
         except Exception as e:
-            messagebox.showerror("Erreur de sauvegarde", f"GRAVE: Impossible de sauvegarder !\n{e}")
+            # May run off the Tk thread: marshal the error dialog back
+            try:
+                self.root.after(0, lambda e=e: messagebox.showerror("Erreur de sauvegarde", f"GRAVE: Impossible de sauvegarder !\n{e}"))
+            except Exception:
+                print(f"Erreur de sauvegarde: {e}")
 
     def setup_ui(self):
         # --- Left Side (PanedWindow) ---
@@ -219,6 +560,7 @@ class ReviewApp:
         self.form_frame.pack(fill="x")
         
         self.fields = {}
+        self.field_vars = {} # name -> StringVar backing the widget
         self.create_field("Commentaire")
         self.create_field("ID", readonly=True)
         self.create_field("Fichier", readonly=True)
@@ -296,21 +638,27 @@ class ReviewApp:
                 self.current_selection_coords = None
 
     # --- Hover Handling ---
+    def _on_box_tag_enter(self, event):
+        # Shared handler for the "box" canvas tag: recover which rectangle
+        # triggered it and map back to the df item
+        hits = self.image_canvas.find_withtag("current")
+        if not hits: return
+        item_id = self.box_map.get(hits[0])
+        if item_id is not None:
+            self.on_box_enter(item_id)
+
     def on_box_enter(self, item_id):
         # Highlight in tree
-        for item in self.sibling_tree.get_children():
-            vals = self.sibling_tree.item(item, 'values')
-            if str(vals[0]) == str(item_id):
-                # We use a tag to highlight
-                self.sibling_tree.item(item, tags=("current", "hovered"))
-                break
+        item = self._tree_iid_by_id.get(str(item_id))
+        if item:
+            # We use a tag to highlight
+            self.sibling_tree.item(item, tags=("current", "hovered"))
 
     def on_box_leave(self, event):
         # Restore tags
         current_id = self.df.at[self.active_df_index, "ID"] if self.active_df_index is not None else None
-        for item in self.sibling_tree.get_children():
-            vals = self.sibling_tree.item(item, 'values')
-            if str(vals[0]) == str(current_id):
+        for obj_id, item in self._tree_iid_by_id.items():
+            if obj_id == str(current_id):
                  self.sibling_tree.item(item, tags=("current",))
             else:
                  self.sibling_tree.item(item, tags=())
@@ -321,36 +669,53 @@ class ReviewApp:
             return
         self._last_hovered_item = item_id
 
-        # Reset canvas boxes first
-        for rect_id in self.box_map:
-             # Check if it's the active one
-             linked_id = self.box_map[rect_id]
-             current_id = self.df.at[self.active_df_index, "ID"] if self.active_df_index is not None else None
+        current_id = self.df.at[self.active_df_index, "ID"] if self.active_df_index is not None else None
+
+        # Reset: restore the active box style and drop any temporary highlight
+        for rect_id, linked_id in self.box_map.items():
              if str(linked_id) == str(current_id):
                  self.image_canvas.itemconfig(rect_id, width=3, outline="#00ff00")
-             else:
-                 self.image_canvas.itemconfig(rect_id, width=1, outline="blue")
+        if self._hover_rect:
+            self.image_canvas.delete(self._hover_rect)
+            self._hover_rect = None
 
         if not item_id: return
         vals = self.sibling_tree.item(item_id, 'values')
         if not vals: return
 
-        obj_id = vals[0]
+        obj_id = str(vals[0])
 
-        # Highlight box on canvas
-        target_rect = None
-        for rect_id, linked_id in self.box_map.items():
-            if str(linked_id) == str(obj_id):
-                target_rect = rect_id
-                break
+        # Active box is a real canvas item: recolor it
+        if obj_id == str(current_id):
+            for rect_id, linked_id in self.box_map.items():
+                if str(linked_id) == obj_id:
+                    self.image_canvas.itemconfig(rect_id, width=4, outline="yellow")
+            return
 
-        if target_rect:
-             self.image_canvas.itemconfig(target_rect, width=4, outline="yellow")
+        # Passive boxes are baked into the bitmap: overlay a highlight rect
+        s_box = self._sibling_boxes.get(obj_id)
+        if s_box:
+            ymin, xmin, ymax, xmax = s_box
+            disp_w, disp_h = self.img_display_size
+            self._hover_rect = self.image_canvas.create_rectangle(
+                (xmin / 1000) * disp_w + self.img_offset_x,
+                (ymin / 1000) * disp_h + self.img_offset_y,
+                (xmax / 1000) * disp_w + self.img_offset_x,
+                (ymax / 1000) * disp_h + self.img_offset_y,
+                outline="yellow", width=4)
 
     # --- Resize Handling ---
     def on_canvas_resize(self, event):
-        # Debounce or just redraw? Just redraw for now
-        if self.original_image_object:
+        # Debounce: <Configure> fires for every pixel of an interactive drag,
+        # so only redraw once the size has been stable for a moment
+        if self._resize_job is not None:
+            try: self.root.after_cancel(self._resize_job)
+            except Exception: pass
+        self._resize_job = self.root.after(80, self._do_canvas_resize)
+
+    def _do_canvas_resize(self):
+        self._resize_job = None
+        if self.original_image_object or getattr(self, 'current_image_path', None):
              # Use current box_2d to redraw correctly
              self.display_image(None, self.current_box_2d)
 
@@ -360,31 +725,54 @@ class ReviewApp:
         self.root.update()
 
     # --- Sibling Navigation ---
-    def _get_next_sibling_index(self, current_idx):
-        """Returns the index of the next object in the SAME image, or None."""
-        if current_idx is None: return None
+    def _rebuild_sibling_links(self):
+        """Precompute df_index -> next df_index in the SAME image (ID order),
+        plus filename -> [df indices] so lookups avoid boolean masks."""
+        self._next_sibling = {}
+        self._siblings_by_file = {}
+        if self.df is None or self.df.empty:
+            return
 
         col_name = "Fichier Original" if "Fichier Original" in self.df.columns else "Fichier"
-        filename = self.df.at[current_idx, col_name]
-
-        # Get all rows for this file
-        siblings = self.df[self.df[col_name] == filename]
+        if col_name not in self.df.columns:
+            return
 
-        # We need to find the "next" sibling.
-        # Logic: Find current index in siblings list, return next one.
-        # Ensure consistent sorting (e.g., by ID)
-        if "ID" in siblings.columns:
+        df = self.df
+        if self._deleted:
+            df = df.drop(index=self._deleted, errors="ignore")
+        if "ID" in df.columns:
             # Sort by ID to ensure logical next
-            siblings = siblings.sort_values("ID")
+            df = df.sort_values("ID")
 
-        sibling_indices = siblings.index.tolist()
+        for fname, group in df.groupby(col_name, sort=False):
+            indices = group.index.tolist()
+            self._siblings_by_file[fname] = indices
+            for a, b in zip(indices, indices[1:]):
+                self._next_sibling[a] = b
 
-        if current_idx in sibling_indices:
-            pos = sibling_indices.index(current_idx)
-            if pos < len(sibling_indices) - 1:
-                return sibling_indices[pos + 1]
+    def _get_next_sibling_index(self, current_idx):
+        """Returns the index of the next object in the SAME image, or None."""
+        if current_idx is None: return None
+        return self._next_sibling.get(current_idx)
 
-        return None
+    def _get_sibling_indices(self, filename):
+        """Returns the df indices of every item on this image (cached)."""
+        return self._siblings_by_file.get(filename, [])
+
+    def _remove_from_sibling_cache(self, idx, filename):
+        """Detaches one row from the sibling caches without a full rebuild."""
+        indices = self._siblings_by_file.get(filename)
+        if not indices or idx not in indices:
+            return
+        indices.remove(idx)
+        self._next_sibling.pop(idx, None)
+        if not indices:
+            del self._siblings_by_file[filename]
+            return
+        # Relink next-pointers for this file only
+        for a, b in zip(indices, indices[1:]):
+            self._next_sibling[a] = b
+        self._next_sibling.pop(indices[-1], None)
 
     def on_sibling_select(self, event):
         selection = self.sibling_tree.selection()
@@ -415,6 +803,10 @@ class ReviewApp:
             self.show_current_item(reload_siblings=False)
 
     def load_category_list(self):
+        global _CATEGORY_CACHE
+        if _CATEGORY_CACHE is not None:
+            return _CATEGORY_CACHE
+
         cats = {}
         try:
             csv_path = os.path.join(self.folder_path, "categories.csv")
@@ -424,14 +816,15 @@ class ReviewApp:
                  else:
                      script_dir = os.path.dirname(os.path.abspath(__file__))
                  csv_path = os.path.join(script_dir, "categories.csv")
-            
+
             if os.path.exists(csv_path):
                 cat_df = pd.read_csv(csv_path)
                 if "id" in cat_df.columns and "nom" in cat_df.columns:
-                    for _, row in cat_df.iterrows():
-                        cats[row["id"]] = row["nom"]
+                    cats = dict(zip(cat_df["id"].to_numpy(), cat_df["nom"].to_numpy()))
         except Exception as e:
             print(f"Error loading categories: {e}")
+
+        _CATEGORY_CACHE = cats
         return cats
 
     def create_field(self, name, readonly=False):
@@ -440,15 +833,18 @@ class ReviewApp:
         lbl = tk.Label(row, text=name, width=20, anchor="w", font=("Arial", 10))
         lbl.pack(side="left")
         
+        var = tk.StringVar()
         if name == "Categorie":
             self.category_map = self.load_category_list()
+            # Reverse map for O(1) name -> id conversion on save/validate
+            self.category_name_to_id = {v: k for k, v in self.category_map.items()}
             display_values = sorted(list(self.category_map.values()))
-            entry = ttk.Combobox(row, values=display_values, font=("Arial", 10), state="readonly")
+            entry = ttk.Combobox(row, textvariable=var, values=display_values, font=("Arial", 10), state="readonly")
         elif name == "Etat":
-            entry = ttk.Combobox(row, values=["Neuf", "Occasion", "Inconnu"], font=("Arial", 10))
+            entry = ttk.Combobox(row, textvariable=var, values=["Neuf", "Occasion", "Inconnu"], font=("Arial", 10))
         else:
-            entry = tk.Entry(row, font=("Arial", 10))
-        
+            entry = tk.Entry(row, textvariable=var, font=("Arial", 10))
+
         entry.pack(side="left", expand=True, fill="x")
         if readonly:
             entry.config(state="readonly")
@@ -457,6 +853,7 @@ class ReviewApp:
         entry.bind("<FocusOut>", lambda e, n=name: self.on_field_focus_out(e, n))
 
         self.fields[name] = entry
+        self.field_vars[name] = var
 
     def on_field_focus_out(self, event, field_name):
         self.save_field_to_df(field_name)
@@ -473,17 +870,24 @@ class ReviewApp:
             # Type conversion logic similar to validate_item
             if field_name == "Categorie":
                  # Convert Name back to ID if possible
-                 for cid, cname in self.category_map.items():
-                    if cname == val:
-                        val = cid
-                        break
+                 val = self.category_name_to_id.get(val, val)
 
             if field_name == "Quantite":
-                 try: val = int(val)
-                 except: pass
+                 parsed = _safe_int(val)
+                 if parsed is not None: val = parsed
             elif field_name in ["Prix Unitaire", "Prix Neuf Estime"]:
-                 try: val = float(val.replace(',', '.'))
-                 except: pass
+                 parsed = _safe_float(val)
+                 if parsed is not None: val = parsed
+
+            # Focus-out fires even on untouched fields: skip the full CSV
+            # rewrite when the value did not actually change.
+            old = self.df.at[self.active_df_index, field_name] if field_name in self.df.columns else None
+            if old is val or old == val: return
+            if (old is None or (isinstance(old, float) and pd.isna(old))) and val in ("", None): return
+            try:
+                if str(old) == str(val): return
+            except Exception:
+                pass
 
             self.df.at[self.active_df_index, field_name] = val
 
@@ -494,7 +898,8 @@ class ReviewApp:
                 self.df.at[self.active_df_index, "Prix Total"] = q * p
             except: pass
 
-            self.save_data()
+            self._journal_append(self.active_df_index, {field_name: val})
+            self._schedule_save()
 
             # Update the sibling tree item specifically
             self._update_sibling_tree_item(self.active_df_index)
@@ -512,30 +917,34 @@ class ReviewApp:
         # Helper to update just the current line in treeview without full rebuild
         try:
              curr_id = self.df.at[idx, "ID"]
-             # Find item in tree
-             for item in self.sibling_tree.get_children():
-                 vals = self.sibling_tree.item(item, 'values')
-                 if str(vals[0]) == str(curr_id):
-                     new_vals = (
-                        curr_id,
-                        self.df.at[idx, "Nom"],
-                        self.df.at[idx, "Quantite"],
-                        self.df.at[idx, "Etat"],
-                        self.df.at[idx, "Fiabilite"]
-                     )
-                     self.sibling_tree.item(item, values=new_vals)
-                     break
+             item = self._tree_iid_by_id.get(str(curr_id))
+             if item:
+                 new_vals = (
+                    curr_id,
+                    self.df.at[idx, "Nom"],
+                    self.df.at[idx, "Quantite"],
+                    self.df.at[idx, "Etat"],
+                    self.df.at[idx, "Fiabilite"]
+                 )
+                 self.sibling_tree.item(item, values=new_vals)
         except: pass
 
+    # Ascending reliability buckets: the first threshold the score is under
+    # wins. Ordered breakpoints instead of interleaved if/elif comparisons,
+    # so boundaries are obvious and adding a bucket is a one-line change.
+    RELIABILITY_COLORS = ((50, "#ffcccc"), (70, "#ffeeba"), (90, "#fff3cd"), (float("inf"), "#ccffcc"))
+
     def _get_reliability_color(self, val):
-        try: score = float(val)
-        except: return "white"
-        if score < 50: return "#ffcccc"
-        elif score >= 90: return "#ccffcc"
-        elif score < 70: return "#ffeeba"
-        else: return "#fff3cd"
+        score = _safe_float(val)
+        if score is None: return "white"
+        for threshold, color in self.RELIABILITY_COLORS:
+            if score < threshold:
+                return color
+        return "white"
 
     def show_current_item(self, reload_siblings=True):
+        # The file must match the screen before we navigate away from it
+        self._flush_rotation()
         if self.selection_rect_id:
             self.image_canvas.delete(self.selection_rect_id)
             self.selection_rect_id = None
@@ -550,12 +959,13 @@ class ReviewApp:
             if self.current_queue_index < len(self.review_queue):
                 current_filename = self.review_queue[self.current_queue_index]
 
-                # Find all items for this file
-                siblings = self.df[self.df[file_col] == current_filename]
+                # Find all items for this file (cache excludes tombstones)
+                sib_indices = self._get_sibling_indices(current_filename)
 
-                if not siblings.empty:
+                if sib_indices:
                     # Pick the one with the lowest reliability to show first
-                    best_candidate = siblings.sort_values("Fiabilite", ascending=True).index[0]
+                    sibs = self.df.loc[sib_indices]
+                    best_candidate = sibs["Fiabilite"].idxmin() if "Fiabilite" in sibs.columns else sib_indices[0]
                     self.active_df_index = best_candidate
                 else:
                     # Should not happen if queue is consistent
@@ -574,7 +984,9 @@ class ReviewApp:
              self.show_current_item()
              return
 
-        row = self.df.loc[idx]
+        # Fetch the row once and drop to a plain dict: every field lookup
+        # below becomes a hash hit instead of a pandas label lookup
+        row = self.df.loc[idx].to_dict()
         current_filename = row.get(file_col, "")
         
         # Status Label Logic
@@ -587,21 +999,29 @@ class ReviewApp:
         for field, entry in self.fields.items():
             val = row.get(field, "")
             if pd.isna(val): val = ""
-            entry.config(state="normal")
-            entry.delete(0, tk.END)
             if field == "Categorie":
                 raw_val = str(val).strip()
                 # Display Name if it's a known ID, otherwise keep existing value (Name or Custom)
-                display_val = self.category_map.get(raw_val, raw_val)
-                entry.set(display_val)
+                new_text = self.category_map.get(raw_val, raw_val)
             else:
-                entry.insert(0, str(val))
-            if field in ["ID", "Fichier", "Fichier Original", "Fiabilite", "Categorie"]:
-                entry.config(state="readonly")
+                new_text = str(val)
+
+            # Skip the update when the widget already shows the right text
+            # (common between sibling rows). StringVar.set works regardless
+            # of the readonly state, so no config round-trips are needed.
+            var = self.field_vars[field]
+            if var.get() == new_text:
+                continue
+
+            var.set(new_text)
             if field == "Fiabilite":
                 color = self._get_reliability_color(val)
                 entry.config(bg=color, readonlybackground=color)
 
+        # Snapshot the displayed strings: validate_item only writes back
+        # the fields the user actually touched
+        self._initial_row_strings = {f: v.get() for f, v in self.field_vars.items()}
+
         filename = row.get("Fichier Original", "")
         if not filename:
             filename = row.get("Fichier", "")
@@ -613,22 +1033,25 @@ class ReviewApp:
                 # Just highlight current
                 self._highlight_sibling(row.get('ID'))
 
-            image_path = os.path.join(self.processed_dir, str(filename))
-            if not os.path.exists(image_path):
-                image_path = os.path.join(self.folder_path, str(filename))
-            
+            # Resolved at load time; one existence check guards against the
+            # file having been moved or added since
+            image_path = self._image_paths.get(str(filename))
+            if not image_path or not os.path.exists(image_path):
+                image_path = os.path.join(self.processed_dir, str(filename))
+                if not os.path.exists(image_path):
+                    image_path = os.path.join(self.folder_path, str(filename))
+                if os.path.exists(image_path):
+                    self._image_paths[str(filename)] = image_path
+
             if os.path.exists(image_path):
                 self.current_image_path = image_path
-                box_2d = None
-                if "Box 2D" in row and pd.notna(row["Box 2D"]):
-                    try:
-                        val = row["Box 2D"]
-                        if isinstance(val, str): box_2d = ast.literal_eval(val)
-                        elif isinstance(val, list): box_2d = val
-                    except: pass
-                
+                box_2d = parse_box(row.get("Box 2D")) if "Box 2D" in row else None
+
                 self.current_box_2d = box_2d
-                self.display_image(image_path, box_2d)
+                # Defer the image kick-off until Tk has painted the form:
+                # the fields update instantly and the photo follows a beat
+                # later (the decode itself already runs on a worker)
+                self.root.after_idle(self._deferred_display, image_path, box_2d)
             else:
                 self.current_image_path = None
                 self.display_placeholder(f"Image introuvable:\n{image_path}")
@@ -636,52 +1059,181 @@ class ReviewApp:
             self.current_image_path = None
             self.display_placeholder("Pas de nom de fichier dans le CSV")
 
+    SIBLING_INSERT_BATCH = 50
+    IMG_CACHE_SIZE = 8 # display-sized bitmaps, ~1 MB each
+
+    def _deferred_display(self, image_path, box_2d):
+        # Scheduled by show_current_item via after_idle; the user may have
+        # navigated again before Tk got here
+        if image_path != self.current_image_path:
+            return
+        self.display_image(image_path, box_2d)
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        """Warms the preview cache with the next couple of queue images so
+        sequential navigation hits the LRU instead of decoding."""
+        canvas_width = self.image_canvas.winfo_width()
+        canvas_height = self.image_canvas.winfo_height()
+        if canvas_width <= 1: canvas_width = 600
+        if canvas_height <= 1: canvas_height = 600
+
+        for k in range(1, 3):
+            pos = self.current_queue_index + k
+            if pos >= len(self.review_queue): break
+            fname = str(self.review_queue[pos])
+            path = self._image_paths.get(fname)
+            if not path: continue # best effort only
+            self._prefetch_pool.submit(self._prefetch_to_cache, path, canvas_width, canvas_height)
+
+    def _prefetch_to_cache(self, path, canvas_width, canvas_height):
+        # Runs on the prefetch pool. Same draft/fit/resize steps as
+        # display_image so the cache key matches exactly. Only PIL objects
+        # are built here; PhotoImage creation stays on the Tk thread.
+        try:
+            img = self._open_image(path)
+            try:
+                img.draft("RGB", (canvas_width * 2, canvas_height * 2))
+            except Exception:
+                pass
+
+            img_ratio = img.width / img.height
+            canvas_ratio = canvas_width / canvas_height
+            if img_ratio > canvas_ratio:
+                new_width = canvas_width
+                new_height = int(new_width / img_ratio)
+            else:
+                new_height = canvas_height
+                new_width = int(new_height * img_ratio)
+            if new_width < 1 or new_height < 1: return
+
+            key = (path, new_width, new_height)
+            if key in self._img_cache: return
+
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            disp = img.resize((new_width, new_height), Image.Resampling.BILINEAR)
+            img.close()
+
+            self._img_cache[key] = disp
+            while len(self._img_cache) > self.IMG_CACHE_SIZE:
+                self._img_cache.popitem(last=False)
+        except Exception:
+            pass
+
     def _update_sibling_list(self, filename, current_id):
+        # Cancel any pending batched insert from a previous image
+        if self._sibling_insert_job:
+            self.root.after_cancel(self._sibling_insert_job)
+            self._sibling_insert_job = None
+
         for item in self.sibling_tree.get_children():
             self.sibling_tree.delete(item)
-            
-        if "Fichier Original" in self.df.columns:
-            siblings = self.df[self.df["Fichier Original"] == filename]
-        elif "Fichier" in self.df.columns:
-             siblings = self.df[self.df["Fichier"] == filename]
-        else: return
-
-        for _, s_row in siblings.iterrows():
-            values = (
-                s_row.get("ID", ""),
-                s_row.get("Nom", ""),
-                s_row.get("Quantite", ""),
-                s_row.get("Etat", ""),
-                s_row.get("Fiabilite", "")
-            )
+        self._tree_iid_by_id = {}
+
+        if "Fichier Original" not in self.df.columns and "Fichier" not in self.df.columns:
+            return
+        siblings = self.df.loc[self._get_sibling_indices(filename)]
+
+        # Build all row tuples first, then insert lazily in batches.
+        # Inserting hundreds of rows in one go freezes Tk (geometry recalcs),
+        # so only the first batch is inserted synchronously and the rest on idle.
+        # One contiguous array fetch replaces per-row Series construction.
+        arr = siblings.reindex(columns=["ID", "Nom", "Quantite", "Etat", "Fiabilite"]).fillna("").to_numpy()
+        self._pending_siblings = [tuple(row) for row in arr]
+        self._sibling_current_id = current_id
+
+        self.sibling_tree.tag_configure("current", background="#d4edda")
+        self.sibling_tree.tag_configure("hovered", background="#e2e6ea")
+
+        self._insert_sibling_batch()
+
+    def _insert_sibling_batch(self):
+        self._sibling_insert_job = None
+        batch = self._pending_siblings[:self.SIBLING_INSERT_BATCH]
+        self._pending_siblings = self._pending_siblings[self.SIBLING_INSERT_BATCH:]
+
+        for values in batch:
             item_id = self.sibling_tree.insert("", "end", values=values)
-            if str(s_row.get("ID")) == str(current_id):
+            self._tree_iid_by_id[str(values[0])] = item_id
+            if str(values[0]) == str(self._sibling_current_id):
                 self.sibling_tree.selection_set(item_id)
                 self.sibling_tree.see(item_id)
                 self.sibling_tree.item(item_id, tags=("current",))
 
-        self.sibling_tree.tag_configure("current", background="#d4edda")
-        self.sibling_tree.tag_configure("hovered", background="#e2e6ea")
+        if self._pending_siblings:
+            self._sibling_insert_job = self.root.after_idle(self._insert_sibling_batch)
 
     def _highlight_sibling(self, current_id):
         # Update selection without rebuilding tree
-        for item in self.sibling_tree.get_children():
-            vals = self.sibling_tree.item(item, 'values')
-            if str(vals[0]) == str(current_id):
+        for obj_id, item in self._tree_iid_by_id.items():
+            if obj_id == str(current_id):
                  self.sibling_tree.selection_set(item)
                  self.sibling_tree.see(item)
                  self.sibling_tree.item(item, tags=("current",))
             else:
                  self.sibling_tree.item(item, tags=())
 
+    def _open_image(self, path):
+        """Opens an image through one mmap-backed read: a single page-cache
+        copy instead of libjpeg's chunked freads. Falls back to a plain
+        open for empty/odd files."""
+        try:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                buf = io.BytesIO(mm)
+                mm.close()
+            return Image.open(buf, formats=_IMAGE_FORMATS)
+        except Exception:
+            # Exotic format or unmappable file: let PIL probe everything
+            return Image.open(path)
+
+    def _get_original(self):
+        """Returns the full-resolution PIL image, reopening it if released."""
+        if self.original_image_object is None and self.current_image_path:
+            # An unflushed rotation means the on-disk file is stale: the
+            # current pixels only exist in the pending write
+            if self._pending_rotation is not None and self._pending_rotation[0] == self.current_image_path:
+                self.original_image_object = self._pending_rotation[1]
+            else:
+                self.original_image_object = self._open_image(self.current_image_path)
+            self.original_image_size = self.original_image_object.size
+        return self.original_image_object
+
+    def _release_original(self):
+        # Drop the decoded full-resolution buffer (can be tens of MB); only
+        # the display-sized copy is needed until the next rotate/rescan.
+        if self.original_image_object is not None:
+            # close() destroys the pixel buffer; if these pixels are still
+            # waiting to be flushed to disk, just drop our reference
+            if self._pending_rotation is None or self.original_image_object is not self._pending_rotation[1]:
+                self.original_image_object.close()
+            self.original_image_object = None
+
+    def _flush_rotation(self):
+        """Writes a coalesced rotation to disk, if one is pending."""
+        if self._rot_save_job is not None:
+            try: self.root.after_cancel(self._rot_save_job)
+            except Exception: pass
+            self._rot_save_job = None
+        pending = self._pending_rotation
+        self._pending_rotation = None
+        if not pending:
+            return
+        path, img = pending
+        try:
+            img.save(path)
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Impossible de sauvegarder la rotation: {e}")
+
     def display_image(self, path=None, box_2d=None):
         try:
             # If path provided, load and cache
             if path:
-                self.original_image_object = Image.open(path)
+                self.original_image_object = self._open_image(path)
                 self.original_image_size = self.original_image_object.size
 
-            img = self.original_image_object
+            img = self._get_original()
             if not img: return
 
             # Calculate resize to fit canvas
@@ -690,7 +1242,29 @@ class ReviewApp:
             if canvas_width <= 1: canvas_width = 600
             if canvas_height <= 1: canvas_height = 600
 
-            img_ratio = img.width / img.height
+            # Draft and resize on a private handle: draft() degrades the
+            # decode in place and the worker reads it concurrently, so the
+            # shared original must stay pristine for rotate/rescan (which
+            # need full resolution). Unflushed rotations only exist in
+            # memory, so those pixels are copied instead of reopened.
+            if self._pending_rotation is not None and self._pending_rotation[0] == self.current_image_path:
+                img_src = img.copy()
+            else:
+                try:
+                    img_src = self._open_image(self.current_image_path) if self.current_image_path else img.copy()
+                except Exception:
+                    img_src = img.copy()
+
+            # JPEG fast path: ask libjpeg to decode at a reduced DCT scale
+            # close to the display size (2x margin keeps the downscale clean).
+            # No-op for other formats or if pixels are already decoded.
+            try:
+                img_src.draft("RGB", (canvas_width * 2, canvas_height * 2))
+            except Exception:
+                pass
+
+            # Aspect math after draft(): it changes img.size but keeps ratio
+            img_ratio = img_src.width / img_src.height
             canvas_ratio = canvas_width / canvas_height
 
             if img_ratio > canvas_ratio:
@@ -702,39 +1276,72 @@ class ReviewApp:
 
             if new_width < 1 or new_height < 1: return
 
-            img_disp = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            self.tk_img = ImageTk.PhotoImage(img_disp)
-
-            self.image_canvas.delete("all")
-            x_center = canvas_width // 2
-            y_center = canvas_height // 2
-            self.image_canvas.create_image(x_center, y_center, image=self.tk_img, anchor="center")
+            # Generation counter: a newer display_image call supersedes any
+            # resize still in flight on the worker thread
+            self._display_gen += 1
+            gen = self._display_gen
+
+            # Small LRU of display-sized bitmaps: flipping back and forth
+            # between queue images skips decode+resize entirely on a hit
+            cache_key = (self.current_image_path, new_width, new_height)
+            img_disp = self._img_cache.get(cache_key) if self.current_image_path else None
+            if img_disp is not None:
+                try: img_src.close()
+                except Exception: pass
+                self._img_cache.move_to_end(cache_key)
+                self._release_original()
+                self._finish_display(img_disp, box_2d, canvas_width, canvas_height, new_width, new_height)
+                return
 
-            self.img_offset_x = x_center - (new_width // 2)
-            self.img_offset_y = y_center - (new_height // 2)
-            self.img_display_size = (new_width, new_height)
-            self.box_map = {} # Reset map
+            # Decode + resize off the UI thread (PIL releases the GIL for
+            # both), then marshal the result back through root.after
+            def work(src=img_src):
+                # Drop alpha and use BILINEAR: visually equivalent at preview
+                # scale, several times faster than LANCZOS on big photos
+                try:
+                    im = src.convert("RGB") if src.mode != "RGB" else src
+                    return im.resize((new_width, new_height), Image.Resampling.BILINEAR)
+                finally:
+                    src.close()
 
-            # Helper to draw box
-            def draw_box(b2d, color, width, dash=None, item_id=None):
-                if b2d and isinstance(b2d, list) and len(b2d) == 4:
+            def done(fut):
+                try:
+                    result = fut.result()
+                except Exception as e:
+                    # Surface decode/resize failures on the canvas instead
+                    # of silently keeping the previous image
                     try:
-                        ymin, xmin, ymax, xmax = b2d
-                        left = (xmin / 1000) * new_width + self.img_offset_x
-                        top = (ymin / 1000) * new_height + self.img_offset_y
-                        right = (xmax / 1000) * new_width + self.img_offset_x
-                        bottom = (ymax / 1000) * new_height + self.img_offset_y
-                        rect_id = self.image_canvas.create_rectangle(left, top, right, bottom, outline=color, width=width, dash=dash)
-                        if item_id is not None:
-                            self.box_map[rect_id] = item_id
-                            # Bind hover events to this rectangle
-                            self.image_canvas.tag_bind(rect_id, "<Enter>", lambda e, i=item_id: self.on_box_enter(i))
-                            self.image_canvas.tag_bind(rect_id, "<Leave>", self.on_box_leave)
-                        return rect_id
-                    except Exception: pass
-                return None
+                        self.root.after(0, self.display_placeholder, f"Erreur image: {e}")
+                    except Exception:
+                        pass # window destroyed
+                    return
+                try:
+                    self.root.after(0, self._on_resize_done, gen, cache_key, result,
+                                    box_2d, canvas_width, canvas_height, new_width, new_height)
+                except Exception:
+                    pass # window destroyed
+
+            self._resize_executor.submit(work).add_done_callback(done)
+
+        except Exception as e:
+            self.display_placeholder(f"Erreur image: {e}")
 
-            # 1. Draw all other siblings if enabled
+    def _on_resize_done(self, gen, cache_key, img_disp, box_2d, canvas_width, canvas_height, new_width, new_height):
+        if gen != self._display_gen:
+            return # a newer display request superseded this one
+        if self.current_image_path and cache_key[0] == self.current_image_path:
+            self._img_cache[cache_key] = img_disp
+            while len(self._img_cache) > self.IMG_CACHE_SIZE:
+                self._img_cache.popitem(last=False)
+        self._release_original()
+        self._finish_display(img_disp, box_2d, canvas_width, canvas_height, new_width, new_height)
+
+    def _finish_display(self, img_disp, box_2d, canvas_width, canvas_height, new_width, new_height):
+        try:
+            # 1. Bake all other siblings' boxes into the bitmap if enabled.
+            # Passive boxes are drawn as pixels in one ImageDraw pass instead of
+            # N canvas items; only the active box stays a canvas item (hover).
+            self._sibling_boxes = {}
             if self.show_all_boxes_var.get() and self.current_image_path:
                 # Resolve filename reliably from DF if possible
                 filename = None
@@ -748,25 +1355,80 @@ class ReviewApp:
                 if not filename:
                     filename = os.path.basename(self.current_image_path)
 
-                siblings = self.df[self.df[col_name] == filename]
+                siblings = self.df.loc[self._get_sibling_indices(filename)]
 
                 current_id = self.df.at[self.active_df_index, "ID"] if self.active_df_index is not None else None
 
-                for idx, row in siblings.iterrows():
-                    # Skip current item, draw it last/special
-                    # Use string comparison to be safe against int/str type mismatches
-                    if str(row.get("ID")) == str(current_id): continue
+                if "Box 2D" in siblings.columns:
+                    # Pull IDs and pre-parsed boxes as plain arrays once instead
+                    # of iterating rows (iterrows builds a Series per row)
+                    ids = siblings["ID"].to_numpy() if "ID" in siblings.columns else [None] * len(siblings)
+                    boxes = siblings["Box 2D"].to_numpy()
+                    curr_str = str(current_id)
+                    for id_val, raw in zip(ids, boxes):
+                        # Skip current item, it's drawn as a canvas item below
+                        # Use string comparison to be safe against int/str type mismatches
+                        if str(id_val) == curr_str: continue
+                        s_box = parse_box(raw)
+                        if s_box:
+                            self._sibling_boxes[str(id_val)] = s_box
+
+                if self._sibling_boxes:
+                    # One vectorized multiply for every box, one draw pass.
+                    # Draw on a copy so the cached bitmap stays clean.
+                    img_disp = img_disp.copy()
+                    arr = np.asarray(list(self._sibling_boxes.values()), dtype=np.float32)
+                    coords = arr * np.array([new_height, new_width, new_height, new_width], dtype=np.float32) / 1000.0
+                    draw = ImageDraw.Draw(img_disp)
+                    for top, left, bottom, right in coords:
+                        draw.rectangle((left, top, right, bottom), outline="blue", width=1)
+
+            # Reuse the existing Tcl photo buffer when the size matches:
+            # paste() blits in place instead of allocating a new Tk image
+            tk_img = getattr(self, 'tk_img', None)
+            if tk_img is not None and (tk_img.width(), tk_img.height()) == img_disp.size:
+                tk_img.paste(img_disp)
+            else:
+                self.tk_img = ImageTk.PhotoImage(img_disp)
+
+            self.image_canvas.delete("all")
+            x_center = canvas_width // 2
+            y_center = canvas_height // 2
+            self.image_canvas.create_image(x_center, y_center, image=self.tk_img, anchor="center")
+
+            self.img_offset_x = x_center - (new_width // 2)
+            self.img_offset_y = y_center - (new_height // 2)
+            self.img_display_size = (new_width, new_height)
+            self.box_map = {} # Reset map
+            self._hover_rect = None
 
-                    s_box = None
-                    if "Box 2D" in row and pd.notna(row["Box 2D"]):
-                         try:
-                            val = row["Box 2D"]
-                            if isinstance(val, str): s_box = ast.literal_eval(val)
-                            elif isinstance(val, list): s_box = val
-                         except: pass
+            # One binding on the shared "box" tag covers every box rectangle:
+            # no per-rectangle lambda/closure allocations on redraw
+            self.image_canvas.tag_bind("box", "<Enter>", self._on_box_tag_enter)
+            self.image_canvas.tag_bind("box", "<Leave>", self.on_box_leave)
 
-                    if s_box:
-                        draw_box(s_box, "blue", 1, None, row.get("ID"))
+            # Hoist scale/offset scalars once: no attribute lookups or repeated
+            # divisions inside the per-box helper
+            sx = new_width / 1000.0
+            sy = new_height / 1000.0
+            ox = self.img_offset_x
+            oy = self.img_offset_y
+
+            # Helper to draw box
+            def draw_box(b2d, color, width, dash=None, item_id=None):
+                if b2d and isinstance(b2d, list) and len(b2d) == 4:
+                    try:
+                        ymin, xmin, ymax, xmax = b2d
+                        left = xmin * sx + ox
+                        top = ymin * sy + oy
+                        right = xmax * sx + ox
+                        bottom = ymax * sy + oy
+                        rect_id = self.image_canvas.create_rectangle(left, top, right, bottom, outline=color, width=width, dash=dash, tags=("box",))
+                        if item_id is not None:
+                            self.box_map[rect_id] = item_id
+                        return rect_id
+                    except Exception: pass
+                return None
 
             # 2. Draw current item box
             if box_2d:
@@ -776,73 +1438,97 @@ class ReviewApp:
         except Exception as e:
             self.display_placeholder(f"Erreur image: {e}")
 
+    def redraw_boxes_only(self):
+        """Redraws only the active box rectangle; keeps the current bitmap.
+        Use when the box changed but the image itself did not (e.g. rescan)."""
+        if not getattr(self, 'img_display_size', None): return
+        self.image_canvas.delete("box")
+        if self._hover_rect:
+            try: self.image_canvas.delete(self._hover_rect)
+            except Exception: pass
+            self._hover_rect = None
+        self.box_map = {}
+
+        b2d = parse_box(self.current_box_2d)
+        if b2d is None: return
+        new_width, new_height = self.img_display_size
+        ymin, xmin, ymax, xmax = b2d
+        left = xmin * new_width / 1000.0 + self.img_offset_x
+        top = ymin * new_height / 1000.0 + self.img_offset_y
+        right = xmax * new_width / 1000.0 + self.img_offset_x
+        bottom = ymax * new_height / 1000.0 + self.img_offset_y
+        rect_id = self.image_canvas.create_rectangle(left, top, right, bottom, outline="#00ff00", width=3, dash=(5, 5), tags=("box",))
+        if self.active_df_index is not None:
+            try:
+                self.box_map[rect_id] = self.df.at[self.active_df_index, "ID"]
+            except Exception: pass
+
     def rotate_image(self, direction="left"):
         if self.current_image_path and os.path.exists(self.current_image_path):
             try:
-                # Rotate the physical image (PIL rotates CCW by default)
-                # left = 90 deg CCW
-                # right = -90 deg CCW
-                angle = 90 if direction == "left" else -90
-                img = Image.open(self.current_image_path)
-                img = img.rotate(angle, expand=True)
-                img.save(self.current_image_path)
-
-                # Rotate Bounding Boxes for ALL items on this image
-                file_col = "Fichier Original" if "Fichier Original" in self.df.columns else "Fichier"
+                # Rotate the physical image. transpose() is a pure pixel
+                # permutation for exact 90-degree turns: no resampling, much
+                # faster than rotate(angle, expand=True) and lossless.
+                # left = 90 deg CCW, right = 90 deg CW
+                # Reuse the cached full-resolution handle instead of decoding
+                # the file a second time, and keep the rotated result cached
+                img = self._get_original()
+                img = img.transpose(Image.Transpose.ROTATE_90 if direction == "left" else Image.Transpose.ROTATE_270)
+                # Coalesce the disk write: rapid presses (90->180->270) cost
+                # one JPEG re-encode instead of one per click, and the file
+                # only goes through a single quality-loss generation
+                self._pending_rotation = (self.current_image_path, img)
+                if self._rot_save_job is not None:
+                    try: self.root.after_cancel(self._rot_save_job)
+                    except Exception: pass
+                self._rot_save_job = self.root.after(1500, self._flush_rotation)
+                self.original_image_object = img
+                self.original_image_size = img.size
+                self._img_cache.clear() # cached previews are now stale
+
+                # Rotate Bounding Boxes for ALL items on this image.
+                # Transform every box at once in normalized (0-1000) space
+                # instead of doing the arithmetic row by row.
                 filename = os.path.basename(self.current_image_path)
 
-                siblings = self.df[self.df[file_col] == filename]
-
-                for idx in siblings.index:
-                    if pd.notna(self.df.at[idx, "Box 2D"]):
-                        try:
-                            val = self.df.at[idx, "Box 2D"]
-                            if isinstance(val, str): b2d = ast.literal_eval(val)
-                            elif isinstance(val, list): b2d = val
-                            else: continue
-
-                            if len(b2d) == 4:
-                                ymin, xmin, ymax, xmax = b2d
-                                # Coordinate Transform in normalized (0-1000) space
-                                
-                                if direction == "left":
-                                    # 90 deg CCW
-                                    # x' = y
-                                    # y' = 1000 - x
-                                    new_ymin = 1000 - xmax
-                                    new_xmin = ymin
-                                    new_ymax = 1000 - xmin
-                                    new_xmax = ymax
-                                else:
-                                    # 90 deg CW (Right)
-                                    # x' = 1000 - y
-                                    # y' = x
-                                    new_ymin = xmin
-                                    new_xmin = 1000 - ymax
-                                    new_ymax = xmax
-                                    new_xmax = 1000 - ymin
-
-                                # Ensure min/max order
-                                final_ymin = min(new_ymin, new_ymax)
-                                final_ymax = max(new_ymin, new_ymax)
-                                final_xmin = min(new_xmin, new_xmax)
-                                final_xmax = max(new_xmin, new_xmax)
-
-                                self.df.at[idx, "Box 2D"] = str([final_ymin, final_xmin, final_ymax, final_xmax])
-                        except Exception as e:
-                            print(f"Failed to rotate box for idx {idx}: {e}")
+                box_indices = []
+                boxes = []
+                for idx in self._get_sibling_indices(filename):
+                    b2d = parse_box(self.df.at[idx, "Box 2D"])
+                    if b2d is not None:
+                        box_indices.append(idx)
+                        boxes.append(b2d)
+
+                if boxes:
+                    try:
+                        arr = np.asarray(boxes, dtype=np.float64)
+                        ymin, xmin, ymax, xmax = arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+                        if direction == "left":
+                            # 90 deg CCW: x' = y, y' = 1000 - x
+                            ys = np.column_stack((1000 - xmax, 1000 - xmin))
+                            xs = np.column_stack((ymin, ymax))
+                        else:
+                            # 90 deg CW: x' = 1000 - y, y' = x
+                            ys = np.column_stack((xmin, xmax))
+                            xs = np.column_stack((1000 - ymax, 1000 - ymin))
+                        # Ensure min/max order and clamp to the 0-1000 space
+                        ys.sort(axis=1)
+                        xs.sort(axis=1)
+                        rotated = np.column_stack((ys[:, 0], xs[:, 0], ys[:, 1], xs[:, 1]))
+                        np.clip(rotated, 0, 1000, out=rotated)
+                        # Single aligned write instead of one .at per row
+                        self.df.loc[box_indices, "Box 2D"] = pd.Series(rotated.tolist(), index=box_indices)
+                    except Exception as e:
+                        print(f"Failed to rotate boxes: {e}")
 
                 # Update current view variables
                 if self.active_df_index is not None:
-                    raw_box = self.df.at[self.active_df_index, "Box 2D"]
-                    if isinstance(raw_box, str):
-                        try: self.current_box_2d = ast.literal_eval(raw_box)
-                        except: self.current_box_2d = None
-                    else:
-                        self.current_box_2d = raw_box
+                    self.current_box_2d = parse_box(self.df.at[self.active_df_index, "Box 2D"])
 
-                self.save_data()
-                self.display_image(self.current_image_path, self.current_box_2d)
+                self._schedule_save()
+                # Redisplay from the rotated in-memory object: passing no path
+                # avoids decoding the file we just wrote all over again
+                self.display_image(None, self.current_box_2d)
             except Exception as e:
                 messagebox.showerror("Erreur", f"Impossible de pivoter l'image: {e}")
 
@@ -855,48 +1541,64 @@ class ReviewApp:
         if idx is not None:
             try:
                 self.df.at[idx, "Commentaire"] = self.get_field_value("Commentaire")
-                self.save_data()
+                self._journal_append(idx, {"Commentaire": self.df.at[idx, "Commentaire"]})
+                self._schedule_save()
                 self.next_item()
             except Exception as e:
                 messagebox.showerror("Erreur", f"Erreur lors du commentaire: {e}")
 
     def get_field_value(self, name):
-        return self.fields[name].get()
+        var = self.field_vars.get(name)
+        return var.get() if var is not None else self.fields[name].get()
 
     def validate_item(self):
         idx = self.active_df_index
         if idx is None: return
         try:
-            self.df.at[idx, "Nom"] = self.get_field_value("Nom")
-            cat_name = self.get_field_value("Categorie")
-            # Convert Name -> ID if possible, else preserve value
-            cat_id = cat_name
-            for cid, cname in self.category_map.items():
-                if cname == cat_name:
-                    cat_id = cid
-                    break
-            self.df.at[idx, "Categorie"] = cat_id
-            self.df.at[idx, "Etat"] = self.get_field_value("Etat")
-            self.df.at[idx, "Commentaire"] = self.get_field_value("Commentaire")
-            
-            try: self.df.at[idx, "Quantite"] = int(self.get_field_value("Quantite"))
-            except: pass
-            
-            try: self.df.at[idx, "Prix Unitaire"] = float(str(self.get_field_value("Prix Unitaire")).replace(',', '.'))
-            except: pass
-            
-            try: self.df.at[idx, "Prix Neuf Estime"] = float(str(self.get_field_value("Prix Neuf Estime")).replace(',', '.'))
-            except: pass
-            
-            try:
-                q = float(self.df.at[idx, "Quantite"])
-                p = float(self.df.at[idx, "Prix Unitaire"])
-                self.df.at[idx, "Prix Total"] = q * p
-            except: pass
-            
-            self.df.at[idx, "Fiabilite"] = 100
-            
-            self.save_data()
+            initial = getattr(self, '_initial_row_strings', {})
+
+            def field_changed(name):
+                return self.get_field_value(name) != initial.get(name)
+
+            # Collect only the fields the user touched, then write the row
+            # in one .loc call (each .at triggers its own indexing pass)
+            updates = {"Fiabilite": 100}
+
+            if field_changed("Nom"):
+                updates["Nom"] = self.get_field_value("Nom")
+            if field_changed("Categorie"):
+                cat_name = self.get_field_value("Categorie")
+                # Convert Name -> ID if possible, else preserve value
+                updates["Categorie"] = self.category_name_to_id.get(cat_name, cat_name)
+            if field_changed("Etat"):
+                updates["Etat"] = self.get_field_value("Etat")
+            if field_changed("Commentaire"):
+                updates["Commentaire"] = self.get_field_value("Commentaire")
+
+            if field_changed("Quantite"):
+                q = _safe_int(self.get_field_value("Quantite"))
+                if q is not None: updates["Quantite"] = q
+
+            if field_changed("Prix Unitaire"):
+                p = _safe_float(self.get_field_value("Prix Unitaire"))
+                if p is not None: updates["Prix Unitaire"] = p
+
+            if field_changed("Prix Neuf Estime"):
+                p = _safe_float(self.get_field_value("Prix Neuf Estime"))
+                if p is not None: updates["Prix Neuf Estime"] = p
+
+            # Only recompute the total when one of its inputs changed
+            if "Quantite" in updates or "Prix Unitaire" in updates:
+                q = _safe_float(updates.get("Quantite", self.df.at[idx, "Quantite"]))
+                p = _safe_float(updates.get("Prix Unitaire", self.df.at[idx, "Prix Unitaire"]))
+                if q is not None and p is not None:
+                    updates["Prix Total"] = q * p
+
+            cols = [c for c in updates if c in self.df.columns]
+            self.df.loc[idx, cols] = [updates[c] for c in cols]
+
+            self._journal_append(idx, {c: updates[c] for c in cols})
+            self._schedule_save()
 
             # Navigate to next object (Sibling -> Next Image)
             next_sibling_idx = self._get_next_sibling_index(idx)
@@ -920,9 +1622,8 @@ class ReviewApp:
         # Check for siblings
         col_name = "Fichier Original" if "Fichier Original" in self.df.columns else "Fichier"
         filename = self.df.at[idx, col_name]
-        siblings = self.df[self.df[col_name] == filename]
 
-        is_last = len(siblings) <= 1
+        is_last = len(self._get_sibling_indices(filename)) <= 1
 
         msg = "Voulez-vous vraiment supprimer cette ligne de l'inventaire ?"
         if is_last:
@@ -934,17 +1635,22 @@ class ReviewApp:
 
         if should_delete:
             try:
-                self.df = self.df.drop(idx)
+                # Tombstone instead of dropping: df.drop copies the whole
+                # frame, so rapid deletes were quadratic. The row is detached
+                # from the caches here and physically removed at save time.
+                self._journal_append(idx, None)
+                self._deleted.add(idx)
+                self._remove_from_sibling_cache(idx, filename)
 
                 # Check if file still has siblings
-                remaining = self.df[self.df[col_name] == filename]
+                remaining = self._get_sibling_indices(filename)
 
-                if remaining.empty:
+                if not remaining:
                     # Remove filename from queue if no items left
                     if filename in self.review_queue:
                         self.review_queue.remove(filename)
-                
-                self.save_data()
+
+                self._schedule_save()
 
                 # Logic for what to show next
                 if is_last:
@@ -956,8 +1662,8 @@ class ReviewApp:
                     self.show_current_item()
                 else:
                     # Siblings exist, switch to one of them
-                    if not remaining.empty:
-                        self.active_df_index = remaining.index[0]
+                    if remaining:
+                        self.active_df_index = remaining[0]
                         self.show_current_item(reload_siblings=True)
                     else:
                         self.active_df_index = None
@@ -968,6 +1674,7 @@ class ReviewApp:
 
     def prev_item(self):
         self.save_current_view()
+        self._flush_save()
         # Move backward to the PREVIOUS IMAGE in queue
         if self.current_queue_index > 0:
             self.current_queue_index -= 1
@@ -992,7 +1699,10 @@ class ReviewApp:
         try:
             self.root.config(cursor="watch")
             self.update_status("Démarrage du rescan...")
-            
+
+            # The AI reads the file from disk: a pending rotation must land first
+            self._flush_rotation()
+
             target_image_path = self.current_image_path
             temp_crop_path = None
             crop_info = None
@@ -1017,7 +1727,9 @@ class ReviewApp:
 
                 if (final_x2 - final_x1) > 10 and (final_y2 - final_y1) > 10:
                     try:
-                        img = Image.open(self.current_image_path)
+                        # Reuse the cached full-resolution handle (decoded at
+                        # most once) rather than re-opening the file
+                        img = self._get_original()
                         crop = img.crop((final_x1, final_y1, final_x2, final_y2))
                         temp_crop_path = os.path.join(self.folder_path, "temp_rescan_crop.jpg")
                         crop.save(temp_crop_path)
@@ -1027,12 +1739,41 @@ class ReviewApp:
                         print(f"Crop failed: {e}")
                         target_image_path = self.current_image_path
 
-            result = analyze_image(target_image_path, categories_context=self.categories_context, user_hint=hint, status_callback=self.update_status)
-            
+            ai = _get_ai()
+            if self.categories_context is None:
+                self.categories_context = ai.load_categories()
+
+            # The API round-trip takes seconds: run it on a worker thread and
+            # marshal the result back with root.after (same pattern as the
+            # launcher's scan thread) so the window stays responsive
+            self._begin_scan()
+            idx = self.active_df_index
+            orig_size = self.original_image_size
+
+            def worker():
+                try:
+                    result = ai.analyze_image(target_image_path, categories_context=self.categories_context, user_hint=hint, status_callback=self._threadsafe_status)
+                    self.root.after(0, self._on_rescan_done, idx, orig_size, result, crop_info, temp_crop_path)
+                except Exception as e:
+                    self.root.after(0, self._on_scan_error, e, temp_crop_path)
+
+            threading.Thread(target=worker, daemon=True).start()
+
+        except Exception as e:
+            self.update_status(f"Erreur: {e}")
+            messagebox.showerror("Erreur", f"Echec de l'analyse: {e}")
+            self._scan_finished()
+
+    def _on_rescan_done(self, idx, orig_size, result, crop_info, temp_crop_path):
+        try:
+            if idx != self.active_df_index:
+                self.update_status("Résultat du rescan ignoré (objet changé entre-temps).")
+                return
+
             if crop_info and result.get("box_2d") and isinstance(result["box_2d"], list) and len(result["box_2d"]) == 4:
                 local_box = result["box_2d"]
                 crop_x, crop_y, crop_w, crop_h = crop_info
-                orig_w, orig_h = self.original_image_size
+                orig_w, orig_h = orig_size
 
                 l_ymin = (local_box[0] / 1000.0) * crop_h
                 l_xmin = (local_box[1] / 1000.0) * crop_w
@@ -1050,18 +1791,45 @@ class ReviewApp:
             # Ensure siblings list is updated because reliability or other data might have changed
             self.show_current_item(reload_siblings=True)
 
-            if temp_crop_path and os.path.exists(temp_crop_path):
-                try: os.remove(temp_crop_path)
-                except: pass
-
             self.update_status("Analyse terminée.")
             messagebox.showinfo("Succès", "Analyse terminée ! Vérifiez les valeurs avant de valider.")
-            
+
         except Exception as e:
             self.update_status(f"Erreur: {e}")
             messagebox.showerror("Erreur", f"Echec de l'analyse: {e}")
         finally:
-            self.root.config(cursor="")
+            if temp_crop_path and os.path.exists(temp_crop_path):
+                try: os.remove(temp_crop_path)
+                except: pass
+            self._scan_finished()
+
+    def _on_scan_error(self, e, temp_crop_path=None):
+        self.update_status(f"Erreur: {e}")
+        messagebox.showerror("Erreur", f"Echec de l'analyse: {e}")
+        if temp_crop_path and os.path.exists(temp_crop_path):
+            try: os.remove(temp_crop_path)
+            except: pass
+        self._scan_finished()
+
+    def _begin_scan(self):
+        # Lock out concurrent scans while the worker is in flight
+        self.root.config(cursor="watch")
+        for btn in (self.btn_rescan, self.btn_multi):
+            try: btn.config(state="disabled")
+            except Exception: pass
+
+    def _scan_finished(self):
+        self.root.config(cursor="")
+        for btn in (self.btn_rescan, self.btn_multi):
+            try: btn.config(state="normal")
+            except Exception: pass
+
+    def _threadsafe_status(self, message):
+        # status_callback fires on the worker thread; hop to the Tk thread
+        try:
+            self.root.after(0, lambda: self.lbl_status.config(text=message, fg="red"))
+        except Exception:
+            pass
 
     def scan_multi_item(self):
         if not self.current_image_path:
@@ -1074,8 +1842,43 @@ class ReviewApp:
         try:
             self.root.config(cursor="watch")
             self.update_status("Démarrage du scan multi-objets...")
-            
-            results = analyze_image_multiple(self.current_image_path, categories_context=self.categories_context, user_hint=hint, target_element=hint, status_callback=self.update_status)
+
+            # The AI reads the file from disk: a pending rotation must land first
+            self._flush_rotation()
+
+            ai = _get_ai()
+            if self.categories_context is None:
+                self.categories_context = ai.load_categories()
+
+            # Same worker-thread pattern as rescan_item: the network call
+            # must not freeze the mainloop
+            self._begin_scan()
+            idx = self.active_df_index
+            image_path = self.current_image_path
+
+            def worker():
+                try:
+                    results = ai.analyze_image_multiple(image_path, categories_context=self.categories_context, user_hint=hint, target_element=hint, status_callback=self._threadsafe_status)
+                    self.root.after(0, self._on_multi_scan_done, idx, results)
+                except Exception as e:
+                    self.root.after(0, self._on_multi_scan_error, e)
+
+            threading.Thread(target=worker, daemon=True).start()
+
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Echec du scan multi: {e}")
+            self._scan_finished()
+
+    def _on_multi_scan_error(self, e):
+        messagebox.showerror("Erreur", f"Echec du scan multi: {e}")
+        self._scan_finished()
+
+    def _on_multi_scan_done(self, idx, results):
+        try:
+            if idx != self.active_df_index:
+                self.update_status("Résultat du scan multi ignoré (objet changé entre-temps).")
+                return
+
             if not isinstance(results, list): results = [results]
             if len(results) == 0:
                 self.update_status("Aucun objet détecté.")
@@ -1095,6 +1898,7 @@ class ReviewApp:
                      try: max_id = self.df["ID"].max()
                      except: pass
                 
+                new_rows = []
                 for i in range(1, len(results)):
                     item = results[i]
                     new_rows_count += 1
@@ -1124,10 +1928,16 @@ class ReviewApp:
                     except: pass
                     
                     if "box_2d" in item and item["box_2d"]:
-                        new_row["Box 2D"] = str(item["box_2d"])
+                        new_row["Box 2D"] = parse_box(item["box_2d"])
+
+                    new_rows.append(new_row)
 
-                    self.df = pd.concat([self.df, pd.DataFrame([new_row])], ignore_index=True)
+                # One concat for the whole batch: each pd.concat copies the
+                # full frame, so concatenating in the loop was quadratic
+                if new_rows:
+                    self.df = pd.concat([self.df, pd.DataFrame(new_rows)], ignore_index=True)
 
+                self._rebuild_sibling_links()
                 self.save_data()
                 self._update_sibling_list(current_row_data.get("Fichier Original"), current_row_data.get("ID"))
 
@@ -1137,24 +1947,16 @@ class ReviewApp:
         except Exception as e:
             messagebox.showerror("Erreur", f"Echec du scan multi: {e}")
         finally:
-            self.root.config(cursor="")
+            self._scan_finished()
 
     def _apply_scan_result(self, result):
-        fields_map = {
-            "Nom": "nom", "Categorie": "categorie", "Etat": "etat",
-            "Quantite": "quantite", "Prix Unitaire": "prix_unitaire_estime",
-            "Prix Neuf Estime": "prix_neuf_estime"
-        }
-        
-        for ui_field, result_key in fields_map.items():
+        for ui_field, result_key in FIELDS_MAP.items():
             if result_key in result:
                 val = result[result_key]
-                if result_key == "quantite":
-                        try: val = int(float(str(val)))
-                        except: pass
-                elif "prix" in result_key:
-                        try: val = float(str(val))
-                        except: pass
+                coerce = _COERCERS.get(result_key)
+                if coerce is not None:
+                        try: val = coerce(val)
+                        except (ValueError, TypeError): pass
                 entry = self.fields.get(ui_field)
                 if entry:
                     entry.config(state="normal")
@@ -1169,23 +1971,22 @@ class ReviewApp:
                 
         if "box_2d" in result and result["box_2d"]:
             idx = self.active_df_index
-            self.df.at[idx, "Box 2D"] = str(result["box_2d"])
+            self.df.at[idx, "Box 2D"] = parse_box(result["box_2d"])
             self.current_box_2d = result["box_2d"]
-            self.display_image(None, self.current_box_2d)
+            # Only the box moved, the bitmap is unchanged
+            self.redraw_boxes_only()
 
         try:
             idx = self.active_df_index
-            for ui_field, result_key in fields_map.items():
+            for ui_field, result_key in FIELDS_MAP.items():
                 if result_key in result:
                     val = result[result_key]
                     if ui_field == "Categorie":
                         if "categorie_id" in result: val = result["categorie_id"]
-                    if ui_field in ["Quantite"]:
-                         try: val = int(float(str(val)))
-                         except: pass
-                    elif ui_field in ["Prix Unitaire", "Prix Neuf Estime"]:
-                         try: val = float(str(val))
-                         except: pass
+                    coerce = _COERCERS.get(result_key)
+                    if coerce is not None:
+                         try: val = coerce(val)
+                         except (ValueError, TypeError): pass
                     self.df.at[idx, ui_field] = val
             
             try:
@@ -1216,7 +2017,10 @@ class ReviewApp:
         if self.current_queue_index >= len(self.review_queue): return
         # Logic here works on Active Index if we are consistent, but typically retake is for bad images.
         current_idx = self.active_df_index
-        
+
+        # The file is about to be copied/moved: a pending rotation must land first
+        self._flush_rotation()
+
         if not self.current_image_path or not os.path.exists(self.current_image_path):
              messagebox.showwarning("Attention", "Pas d'image trouvée à déplacer.")
         
@@ -1227,10 +2031,7 @@ class ReviewApp:
             
             sharing_indices = []
             if filename:
-                 if "Fichier Original" in self.df.columns:
-                     sharing_indices = self.df[self.df["Fichier Original"] == filename].index.tolist()
-                 elif "Fichier" in self.df.columns:
-                     sharing_indices = self.df[self.df["Fichier"] == filename].index.tolist()
+                 sharing_indices = list(self._get_sibling_indices(filename))
 
             is_multi_object = len(sharing_indices) > 1
             indices_to_drop = [current_idx]
@@ -1269,15 +2070,16 @@ class ReviewApp:
                         img.close()
                         os.remove(self.current_image_path)
                         self.current_image_path = None
+                        self._image_paths.pop(filename, None) # path is stale now
                      except Exception: pass
 
-            col_name = "Fichier Original" if "Fichier Original" in self.df.columns else "Fichier"
             if indices_to_drop:
                 self.df = self.df.drop(indices_to_drop)
-                
+                self._rebuild_sibling_links()
+
                 # Update queue - remove filename if no items left
-                remaining = self.df[self.df[col_name] == filename]
-                if remaining.empty and filename in self.review_queue:
+                remaining = self._get_sibling_indices(filename)
+                if not remaining and filename in self.review_queue:
                     self.review_queue.remove(filename)
 
                 self.active_df_index = None # Reset
@@ -1295,6 +2097,7 @@ class ReviewApp:
 
     def next_item(self):
         self.save_current_view()
+        self._flush_save()
         # Move forward to the NEXT IMAGE in queue
         if self.current_queue_index < len(self.review_queue) - 1:
             self.current_queue_index += 1
@@ -1306,6 +2109,7 @@ class ReviewApp:
         self.show_current_item()
 
 if __name__ == "__main__":
+    import argparse
     parser = argparse.ArgumentParser(description="Review inventory items.")
     parser.add_argument("csv_file", help="Path to the inventory CSV file")
     args = parser.parse_args()
@@ -34,3 +34,31 @@ def test_imports():
         assert ui_utils is not None
     except ImportError as e:
         pytest.fail(f"Could not import ui_utils: {e}")
+
+def test_parse_helpers():
+    """Test the pure parsing helpers used by the review GUI."""
+    os.environ["GEMINI_API_KEY"] = "dummy_key"
+    sys.modules["google.generativeai"] = MagicMock()
+
+    from review_gui import parse_box, _safe_int, _safe_float
+
+    assert parse_box("[10, 20, 30, 40]") == [10, 20, 30, 40]
+    assert parse_box([1, 2, 3, 4]) == [1, 2, 3, 4]
+    assert parse_box("not a box") is None
+    assert parse_box(None) is None
+
+    assert _safe_int("12") == 12
+    assert _safe_int("abc") is None
+    assert _safe_float("3,5") == 3.5
+    assert _safe_float("") is None
+
+def test_is_newer():
+    """Test version comparison used by the update check."""
+    from update_checker import is_newer
+
+    assert is_newer("2.0.0", "1.9.9")
+    assert not is_newer("1.0.0", "1.0.0")
+    assert not is_newer("1.0.0", "1.0.1")
+    assert is_newer("1.10.0", "1.9.0")  # numeric, not lexicographic
+    assert not is_newer(None, "1.0.0")
+    assert not is_newer("abc", "1.0.0")
@@ -3,13 +3,20 @@ import tkinter as tk
 class ToolTip(object):
     """
     create a tooltip for a given widget
+
+    All tooltips share a single Toplevel+Label pair: showing one just moves,
+    retexts and deiconifies the shared window instead of building and
+    destroying Tk objects on every hover.
     """
+    _shared_window = None
+    _shared_label = None
+
     def __init__(self, widget, text='widget info'):
         self.widget = widget
         self.text = text
         self.widget.bind("<Enter>", self.enter)
         self.widget.bind("<Leave>", self.leave)
-        self.tipwindow = None
+        self.showing = False
         self.id = None
         self.x = self.y = 0
 
@@ -30,26 +37,40 @@ class ToolTip(object):
         if id:
             self.widget.after_cancel(id)
 
+    @classmethod
+    def _get_shared(cls, widget):
+        # Created on first use; recreated if its owning window was closed
+        if cls._shared_window is None or not cls._shared_window.winfo_exists():
+            tw = tk.Toplevel(widget.winfo_toplevel())
+            tw.wm_overrideredirect(True)
+            tw.withdraw()
+            label = tk.Label(tw, justify='left',
+                           background="#ffffe0", relief='solid', borderwidth=1,
+                           font=("tahoma", "9", "normal"), padx=5, pady=2)
+            label.pack(ipadx=1)
+            cls._shared_window = tw
+            cls._shared_label = label
+        return cls._shared_window, cls._shared_label
+
     def showtip(self, event=None):
         x = y = 0
         try:
             x, y, cx, cy = self.widget.bbox("insert")
         except:
             pass
-        
+
         x = x + self.widget.winfo_rootx() + 25
         y = y + self.widget.winfo_rooty() + 20
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
+        tw, label = self._get_shared(self.widget)
+        label.config(text=self.text)
         tw.wm_geometry("+%d+%d" % (x, y))
-        
-        label = tk.Label(tw, text=self.text, justify='left',
-                       background="#ffffe0", relief='solid', borderwidth=1,
-                       font=("tahoma", "9", "normal"), padx=5, pady=2)
-        label.pack(ipadx=1)
+        tw.deiconify()
+        tw.lift()
+        self.showing = True
 
     def hidetip(self):
-        tw = self.tipwindow
-        self.tipwindow = None
-        if tw:
-            tw.destroy()
+        if self.showing:
+            self.showing = False
+            tw = type(self)._shared_window
+            if tw and tw.winfo_exists():
+                tw.withdraw()
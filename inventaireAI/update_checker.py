@@ -1,8 +1,34 @@
 import urllib.request
+import urllib.error
 import json
+import os
 import threading
 from version_info import VERSION, GITHUB_UPDATE_URL
 
+# Validators (ETag/Last-Modified) from the last successful check, stored next
+# to this file so the server can answer 304 without resending the body
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "update_check.cache.json")
+
+def _load_cached_check():
+    try:
+        with open(_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def _save_cached_check(headers, version):
+    # Best effort: a read-only install directory just means no 304s
+    try:
+        data = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "version": version,
+        }
+        with open(_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except Exception:
+        pass
+
 def check_for_updates_thread(callback):
     """
     Runs check_for_updates in a separate thread and calls callback(result).
@@ -11,7 +37,7 @@ def check_for_updates_thread(callback):
     def run():
         res = check_for_updates()
         callback(res)
-        
+
     threading.Thread(target=run, daemon=True).start()
 
 def check_for_updates():
@@ -23,23 +49,53 @@ def check_for_updates():
     if "VOTRE_USER" in GITHUB_UPDATE_URL:
         return (False, None, "URL non configurée")
 
+    cached = _load_cached_check()
+    req = urllib.request.Request(GITHUB_UPDATE_URL)
+    if cached.get("etag"):
+        req.add_header("If-None-Match", cached["etag"])
+    if cached.get("last_modified"):
+        req.add_header("If-Modified-Since", cached["last_modified"])
+    # version.json is a handful of keys; ask for the first KiB only.
+    # Servers that ignore Range just answer 200 with the full body.
+    req.add_header("Range", "bytes=0-1023")
+
     try:
-        with urllib.request.urlopen(GITHUB_UPDATE_URL, timeout=3) as url:
-            data = json.loads(url.read().decode())
+        with urllib.request.urlopen(req, timeout=3) as url:
+            # json.loads accepts bytes directly, no decode round-trip
+            data = json.loads(url.read())
             remote_version = data.get("version")
-            
+            _save_cached_check(url.headers, remote_version)
+
             if is_newer(remote_version, VERSION):
                 return (True, remote_version, None)
             else:
                 return (False, remote_version, None)
-                
+
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            # Unchanged since the last check: reuse the cached version string
+            remote_version = cached.get("version")
+            if is_newer(remote_version, VERSION):
+                return (True, remote_version, None)
+            return (False, remote_version, None)
+        return (False, None, str(e))
     except Exception as e:
         return (False, None, str(e))
 
-def is_newer(remote, local):
+# The local version is a constant: parse it once at import
+try:
+    _LOCAL_PARTS = tuple(int(p) for p in VERSION.split('.'))
+except ValueError:
+    _LOCAL_PARTS = ()
+
+def is_newer(remote, local=VERSION):
+    try:
+        r_parts = tuple(int(p) for p in remote.split('.'))
+    except (AttributeError, ValueError):
+        return False # None or malformed remote version
+    if local == VERSION:
+        return r_parts > _LOCAL_PARTS
     try:
-        r_parts = [int(p) for p in remote.split('.')]
-        l_parts = [int(p) for p in local.split('.')]
-        return r_parts > l_parts
-    except:
+        return r_parts > tuple(int(p) for p in local.split('.'))
+    except ValueError:
         return False